@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import sys
+from collections.abc import Mapping
+from typing import Any
 
 from reolink_cli import __version__
 from reolink_cli.client import (
@@ -21,8 +24,13 @@ from reolink_cli.commands import alerts, controls, detection, device, media, sys
 from reolink_cli.output import print_error
 
 
+@functools.cache
 def _build_parser() -> argparse.ArgumentParser:
-    """Build the top-level argument parser with global flags and subcommands."""
+    """Build the top-level argument parser with global flags and subcommands.
+
+    The parser is built once and reused. Connection flags default to None so
+    that environment variables are resolved per call in :func:`_client_kwargs`.
+    """
     parser = argparse.ArgumentParser(
         prog="reolink",
         description="Command-line interface for controlling Reolink cameras.",
@@ -32,22 +40,18 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--host", metavar="HOST",
-        default=os.environ.get("REOLINK_HOST"),
         help="Camera IP or hostname (env: REOLINK_HOST)",
     )
     parser.add_argument(
         "--user", metavar="USER",
-        default=os.environ.get("REOLINK_USER", "admin"),
         help="Username (default: admin, env: REOLINK_USER)",
     )
     parser.add_argument(
         "--password", metavar="PASS", dest="password",
-        default=os.environ.get("REOLINK_PASS"),
         help="Password (env: REOLINK_PASS)",
     )
     parser.add_argument(
         "--channel", metavar="CH", type=int,
-        default=int(os.environ.get("REOLINK_CHANNEL", "0")),
         help="Channel index (default: 0, env: REOLINK_CHANNEL)",
     )
     parser.add_argument(
@@ -75,6 +79,28 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _client_kwargs(args: argparse.Namespace, env: Mapping[str, str]) -> dict[str, Any]:
+    """Resolve ReolinkClient keyword arguments from CLI args and environment.
+
+    Flags take precedence over the REOLINK_* environment variables.
+
+    Args:
+        args: Parsed argument namespace with host, user, password, channel, timeout.
+        env: Environment mapping to fall back on (normally ``os.environ``).
+
+    Returns:
+        Keyword arguments for ReolinkClient. host and password may be None.
+    """
+    return {
+        "host": args.host if args.host is not None else env.get("REOLINK_HOST"),
+        "password": args.password if args.password is not None else env.get("REOLINK_PASS"),
+        "username": args.user if args.user is not None else env.get("REOLINK_USER", "admin"),
+        "channel": (args.channel if args.channel is not None
+                    else int(env.get("REOLINK_CHANNEL", "0"))),
+        "timeout": args.timeout,
+    }
+
+
 def _make_client(args: argparse.Namespace) -> ReolinkClient:
     """Create a ReolinkClient from parsed CLI args.
 
@@ -84,19 +110,14 @@ def _make_client(args: argparse.Namespace) -> ReolinkClient:
     Returns:
         Configured ReolinkClient instance.
     """
-    if not args.host:
+    kwargs = _client_kwargs(args, os.environ)
+    if not kwargs["host"]:
         print_error("--host is required (or set REOLINK_HOST)")
         sys.exit(EXIT_USAGE)
-    if not args.password:
+    if not kwargs["password"]:
         print_error("--password is required (or set REOLINK_PASS)")
         sys.exit(EXIT_USAGE)
-    return ReolinkClient(
-        host=args.host,
-        password=args.password,
-        username=args.user,
-        channel=args.channel,
-        timeout=args.timeout,
-    )
+    return ReolinkClient(**kwargs)
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import argparse
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from reolink_cli.client import UnsupportedError
 from reolink_cli.output import output
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from reolink_cli.client import ReolinkClient
 
 
@@ -47,6 +49,15 @@ _CHARGE_STATUS = {0: "Not Charging", 1: "Charging"}
 _SLEEP_STATE = {0: "Awake", 1: "Sleeping", 2: "Deep Sleep"}
 _ADAPTER_STATUS = {0: "Disconnected", 1: "Connected"}
 
+# Per-field battery value formatters; fields not listed are shown with str()
+_BATTERY_FORMAT: dict[str, Callable[[Any], str]] = {
+    "batteryPercent": lambda val: f"{val}%",
+    "chargeStatus": lambda val: _CHARGE_STATUS.get(val, str(val)),
+    "temperature": lambda val: f"{val}°C",
+    "sleepState": lambda val: _SLEEP_STATE.get(val, str(val)),
+    "adapterStatus": lambda val: _ADAPTER_STATUS.get(val, str(val)),
+}
+
 
 def _cmd_info(args: argparse.Namespace, client: ReolinkClient) -> None:
     """Show device information."""
@@ -74,21 +85,8 @@ def _cmd_battery(args: argparse.Namespace, client: ReolinkClient) -> None:
 
     display: dict[str, str] = {}
     for key, label in _BATTERY_FIELDS.items():
-        if key not in raw:
-            continue
-        val = raw[key]
-        if key == "batteryPercent":
-            display[label] = f"{val}%"
-        elif key == "chargeStatus":
-            display[label] = _CHARGE_STATUS.get(val, str(val))
-        elif key == "temperature":
-            display[label] = f"{val}°C"
-        elif key == "sleepState":
-            display[label] = _SLEEP_STATE.get(val, str(val))
-        elif key == "adapterStatus":
-            display[label] = _ADAPTER_STATUS.get(val, str(val))
-        else:
-            display[label] = str(val)
+        if key in raw:
+            display[label] = _BATTERY_FORMAT.get(key, str)(raw[key])
     output(display, title="Battery Status")
 
 
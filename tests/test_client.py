@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
 
 import pytest
 import requests
@@ -49,6 +49,7 @@ from tests.conftest import (
     USER_RESPONSE,
     WHITE_LED_RESPONSE,
     WIFI_SIGNAL_RESPONSE,
+    FakeResponse,
 )
 
 
@@ -56,36 +57,34 @@ class TestLogin:
     """Tests for login/logout flow."""
 
     def test_login_success(self, client, mock_post, mock_response):
-        mock_response.json.return_value = LOGIN_SUCCESS_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = LOGIN_SUCCESS_RESPONSE
 
         client.login()
         assert client._token == "abc123token"
         mock_post.assert_called_once()
 
-    def test_login_auth_failure(self, client, mock_post, mock_response):
-        mock_response.json.return_value = LOGIN_FAILURE_RESPONSE
-        mock_post.return_value = mock_response
-
-        with pytest.raises(AuthError, match="login failed"):
+    @pytest.mark.parametrize(
+        ("response", "post_error", "error", "match"),
+        [
+            pytest.param(LOGIN_FAILURE_RESPONSE, None, AuthError, "login failed",
+                         id="auth-failure"),
+            pytest.param(None, requests.ConnectionError("refused"), NetworkError,
+                         "Cannot connect", id="network-error"),
+            pytest.param(None, requests.Timeout("timed out"), NetworkError,
+                         "timed out", id="timeout"),
+        ],
+    )
+    def test_login_failure(self, client, mock_post, mock_response,
+                           response, post_error, error, match):
+        mock_response.payload = response
+        mock_post.side_effect = post_error
+
+        with pytest.raises(error, match=match):
             client.login()
         assert client._token is None
 
-    def test_login_network_error(self, client, mock_post):
-        mock_post.side_effect = requests.ConnectionError("refused")
-
-        with pytest.raises(NetworkError, match="Cannot connect"):
-            client.login()
-
-    def test_login_timeout(self, client, mock_post):
-        mock_post.side_effect = requests.Timeout("timed out")
-
-        with pytest.raises(NetworkError, match="timed out"):
-            client.login()
-
     def test_logout(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = [{"cmd": "Logout", "code": 0, "value": {}}]
-        mock_post.return_value = mock_response
+        mock_response.payload = [{"cmd": "Logout", "code": 0, "value": {}}]
 
         logged_in_client.logout()
         assert logged_in_client._token is None
@@ -95,8 +94,7 @@ class TestLogin:
         client.logout()
 
     def test_context_manager(self, mock_post, mock_response):
-        mock_response.json.return_value = LOGIN_SUCCESS_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = LOGIN_SUCCESS_RESPONSE
 
         with ReolinkClient("192.168.1.100", "pass") as c:
             c.login()
@@ -110,33 +108,29 @@ class TestExecute:
 
     def test_execute_auto_login(self, client, mock_post, mock_response):
         # First call returns login, second returns device info
-        mock_response.json.side_effect = [
+        mock_response.payloads = iter((
             LOGIN_SUCCESS_RESPONSE,
             DEVICE_INFO_RESPONSE,
-        ]
-        mock_post.return_value = mock_response
+        ))
 
         result = client.execute("GetDevInfo")
         assert result["DevInfo"]["model"] == "Argus 4 Pro"
         assert mock_post.call_count == 2  # login + execute
 
     def test_execute_already_logged_in(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = DEVICE_INFO_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = DEVICE_INFO_RESPONSE
 
         result = logged_in_client.execute("GetDevInfo")
         assert result["DevInfo"]["model"] == "Argus 4 Pro"
 
     def test_execute_api_error(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = API_ERROR_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = API_ERROR_RESPONSE
 
         with pytest.raises(ApiError, match="something went wrong"):
             logged_in_client.execute("GetDevInfo")
 
     def test_execute_unsupported(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = UNSUPPORTED_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = UNSUPPORTED_RESPONSE
 
         with pytest.raises(UnsupportedError):
             logged_in_client.execute("GetPtzPreset")
@@ -149,8 +143,7 @@ class TestExecute:
                 "error": {"detail": "please login first", "rspCode": -6},
             }
         ]
-        mock_response.json.return_value = auth_err_response
-        mock_post.return_value = mock_response
+        mock_response.payload = auth_err_response
 
         with pytest.raises(AuthError):
             logged_in_client.execute("GetDevInfo")
@@ -160,8 +153,7 @@ class TestGetDeviceInfo:
     """Tests for the get_device_info convenience method."""
 
     def test_get_device_info(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = DEVICE_INFO_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = DEVICE_INFO_RESPONSE
 
         info = logged_in_client.get_device_info()
         assert info["model"] == "Argus 4 Pro"
@@ -173,8 +165,7 @@ class TestGetBatteryInfo:
     """Tests for battery info retrieval."""
 
     def test_get_battery_info(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = BATTERY_INFO_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = BATTERY_INFO_RESPONSE
 
         info = logged_in_client.get_battery_info()
         assert info["batteryPercent"] == 85
@@ -186,8 +177,7 @@ class TestGetHddInfo:
     """Tests for storage info retrieval."""
 
     def test_get_hdd_info(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = HDD_INFO_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = HDD_INFO_RESPONSE
 
         info = logged_in_client.get_hdd_info()
         assert len(info) == 1
@@ -199,24 +189,21 @@ class TestGetNetworkInfo:
     """Tests for network info retrieval."""
 
     def test_get_local_link(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = LOCAL_LINK_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = LOCAL_LINK_RESPONSE
 
         info = logged_in_client.get_local_link()
         assert info["activeLink"] == "WiFi"
         assert info["mac"] == "AA:BB:CC:DD:EE:FF"
 
     def test_get_net_port(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = NET_PORT_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = NET_PORT_RESPONSE
 
         info = logged_in_client.get_net_port()
         assert info["rtspPort"] == 554
         assert info["httpPort"] == 80
 
     def test_get_wifi_signal(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = WIFI_SIGNAL_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = WIFI_SIGNAL_RESPONSE
 
         signal = logged_in_client.get_wifi_signal()
         assert signal == -45
@@ -226,8 +213,7 @@ class TestGetTime:
     """Tests for time retrieval."""
 
     def test_get_time(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = TIME_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = TIME_RESPONSE
 
         info = logged_in_client.get_time()
         assert "Time" in info
@@ -239,8 +225,7 @@ class TestGetAbility:
     """Tests for capability retrieval."""
 
     def test_get_ability(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = ABILITY_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = ABILITY_RESPONSE
 
         info = logged_in_client.get_ability()
         assert "channelNum" in info
@@ -250,101 +235,66 @@ class TestGetAbility:
 class TestGetDetection:
     """Tests for motion and AI detection retrieval."""
 
-    def test_get_md_alarm(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = MD_ALARM_RESPONSE
-        mock_post.return_value = mock_response
-
-        info = logged_in_client.get_md_alarm()
-        assert info["enable"] == 1
-
-    def test_get_md_state(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = MD_STATE_RESPONSE
-        mock_post.return_value = mock_response
-
-        info = logged_in_client.get_md_state()
-        assert info["state"] == 0
+    @pytest.mark.parametrize(
+        ("method", "response", "expected"),
+        [
+            pytest.param("get_md_alarm", MD_ALARM_RESPONSE, {"enable": 1}, id="md_alarm"),
+            pytest.param("get_md_state", MD_STATE_RESPONSE, {"state": 0}, id="md_state"),
+            pytest.param("get_ai_cfg", AI_CFG_RESPONSE, {"people": 1, "dog_cat": 1},
+                         id="ai_cfg"),
+        ],
+    )
+    def test_getter(self, logged_in_client, mock_post, mock_response,
+                    method, response, expected):
+        mock_response.payload = response
+
+        info = getattr(logged_in_client, method)()
+        for key, value in expected.items():
+            assert info[key] == value
 
     def test_get_ai_state(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = AI_STATE_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = AI_STATE_RESPONSE
 
         info = logged_in_client.get_ai_state()
         assert info["people"]["alarm_state"] == 1
         assert info["vehicle"]["support"] == 1
 
-    def test_get_ai_cfg(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = AI_CFG_RESPONSE
-        mock_post.return_value = mock_response
-
-        info = logged_in_client.get_ai_cfg()
-        assert info["people"] == 1
-        assert info["dog_cat"] == 1
-
 
 class TestGetControls:
     """Tests for light, image, encoding, and audio retrieval."""
 
-    def test_get_ir_lights(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = IR_LIGHTS_RESPONSE
-        mock_post.return_value = mock_response
-
-        info = logged_in_client.get_ir_lights()
-        assert info["state"] == "Auto"
-
-    def test_get_white_led(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = WHITE_LED_RESPONSE
-        mock_post.return_value = mock_response
-
-        info = logged_in_client.get_white_led()
-        assert info["state"] == 1
-        assert info["bright"] == 75
-
-    def test_get_power_led(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = POWER_LED_RESPONSE
-        mock_post.return_value = mock_response
-
-        info = logged_in_client.get_power_led()
-        assert info["state"] == 1
-
-    def test_get_image(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = IMAGE_RESPONSE
-        mock_post.return_value = mock_response
-
-        info = logged_in_client.get_image()
-        assert info["bright"] == 128
-        assert info["contrast"] == 128
-
-    def test_get_isp(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = ISP_RESPONSE
-        mock_post.return_value = mock_response
-
-        info = logged_in_client.get_isp()
-        assert info["dayNight"] == "Auto"
-        assert info["hdr"] == 1
+    @pytest.mark.parametrize(
+        ("method", "response", "expected"),
+        [
+            pytest.param("get_ir_lights", IR_LIGHTS_RESPONSE, {"state": "Auto"},
+                         id="ir_lights"),
+            pytest.param("get_white_led", WHITE_LED_RESPONSE, {"state": 1, "bright": 75},
+                         id="white_led"),
+            pytest.param("get_power_led", POWER_LED_RESPONSE, {"state": 1}, id="power_led"),
+            pytest.param("get_image", IMAGE_RESPONSE, {"bright": 128, "contrast": 128},
+                         id="image"),
+            pytest.param("get_isp", ISP_RESPONSE, {"dayNight": "Auto", "hdr": 1}, id="isp"),
+            pytest.param("get_audio_cfg", AUDIO_CFG_RESPONSE,
+                         {"micVolume": 80, "recordEnable": 1}, id="audio_cfg"),
+            pytest.param("get_audio_alarm", AUDIO_ALARM_RESPONSE, {"enable": 1},
+                         id="audio_alarm"),
+        ],
+    )
+    def test_getter(self, logged_in_client, mock_post, mock_response,
+                    method, response, expected):
+        mock_response.payload = response
+
+        info = getattr(logged_in_client, method)()
+        for key, value in expected.items():
+            assert info[key] == value
 
     def test_get_enc(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = ENC_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = ENC_RESPONSE
 
         info = logged_in_client.get_enc()
         assert info["mainStream"]["bitRate"] == 4096
         assert info["subStream"]["video"]["codec"] == "h264"
 
-    def test_get_audio_cfg(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = AUDIO_CFG_RESPONSE
-        mock_post.return_value = mock_response
-
-        info = logged_in_client.get_audio_cfg()
-        assert info["micVolume"] == 80
-        assert info["recordEnable"] == 1
-
-    def test_get_audio_alarm(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = AUDIO_ALARM_RESPONSE
-        mock_post.return_value = mock_response
-
-        info = logged_in_client.get_audio_alarm()
-        assert info["enable"] == 1
-
 
 class TestClientInit:
     """Tests for client initialization."""
@@ -369,21 +319,21 @@ class TestClientInit:
 class TestSnap:
     """Tests for snapshot capture."""
 
-    @patch("reolink_cli.client.requests.get")
-    def test_snap(self, mock_get, logged_in_client):
-        mock_resp = MagicMock()
-        mock_resp.headers = {"content-type": "image/jpeg"}
-        mock_resp.content = b"\xff\xd8\xff\xe0" + b"\x00" * 100
-        mock_resp.raise_for_status = MagicMock()
-        mock_get.return_value = mock_resp
+    def test_snap(self, monkeypatch, logged_in_client):
+        mock_resp = FakeResponse(
+            headers={"content-type": "image/jpeg"},
+            content=b"\xff\xd8\xff\xe0" + b"\x00" * 100,
+        )
+        mock_get = Mock(return_value=mock_resp)
+        monkeypatch.setattr("reolink_cli.client.requests.get", mock_get)
 
         data = logged_in_client.snap()
         assert data.startswith(b"\xff\xd8")
         mock_get.assert_called_once()
 
-    @patch("reolink_cli.client.requests.get")
-    def test_snap_network_error(self, mock_get, logged_in_client):
-        mock_get.side_effect = requests.ConnectionError("refused")
+    def test_snap_network_error(self, monkeypatch, logged_in_client):
+        mock_get = Mock(side_effect=requests.ConnectionError("refused"))
+        monkeypatch.setattr("reolink_cli.client.requests.get", mock_get)
 
         with pytest.raises(NetworkError, match="Cannot connect"):
             logged_in_client.snap()
@@ -393,8 +343,7 @@ class TestGetRec:
     """Tests for recording config retrieval."""
 
     def test_get_rec(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = REC_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = REC_RESPONSE
 
         info = logged_in_client.get_rec()
         assert info["enable"] == 1
@@ -406,8 +355,7 @@ class TestSearchRecordings:
     """Tests for recording search."""
 
     def test_search_recordings(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = SEARCH_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = SEARCH_RESPONSE
 
         files = logged_in_client.search_recordings(
             start_time={"year": 2026, "mon": 2, "day": 10, "hour": 0, "min": 0, "sec": 0},
@@ -422,57 +370,48 @@ class TestSetters:
     """Tests for setter methods."""
 
     def test_set_md_alarm(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.side_effect = [MD_ALARM_RESPONSE, SET_SUCCESS_RESPONSE]
-        mock_post.return_value = mock_response
+        mock_response.payloads = iter((MD_ALARM_RESPONSE, SET_SUCCESS_RESPONSE))
 
         logged_in_client.set_md_alarm(enable=False)
         assert mock_post.call_count >= 2
 
     def test_set_ir_lights(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = SET_SUCCESS_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = SET_SUCCESS_RESPONSE
 
         logged_in_client.set_ir_lights("Off")
 
     def test_set_white_led(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.side_effect = [WHITE_LED_RESPONSE, SET_SUCCESS_RESPONSE]
-        mock_post.return_value = mock_response
+        mock_response.payloads = iter((WHITE_LED_RESPONSE, SET_SUCCESS_RESPONSE))
 
         logged_in_client.set_white_led(state=0)
 
     def test_set_power_led(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = SET_SUCCESS_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = SET_SUCCESS_RESPONSE
 
         logged_in_client.set_power_led(0)
 
     def test_set_image(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.side_effect = [IMAGE_RESPONSE, SET_SUCCESS_RESPONSE]
-        mock_post.return_value = mock_response
+        mock_response.payloads = iter((IMAGE_RESPONSE, SET_SUCCESS_RESPONSE))
 
         logged_in_client.set_image(bright=200)
 
     def test_set_isp(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.side_effect = [ISP_RESPONSE, SET_SUCCESS_RESPONSE]
-        mock_post.return_value = mock_response
+        mock_response.payloads = iter((ISP_RESPONSE, SET_SUCCESS_RESPONSE))
 
         logged_in_client.set_isp(rotation=180)
 
     def test_set_enc(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.side_effect = [ENC_RESPONSE, SET_SUCCESS_RESPONSE]
-        mock_post.return_value = mock_response
+        mock_response.payloads = iter((ENC_RESPONSE, SET_SUCCESS_RESPONSE))
 
         logged_in_client.set_enc(stream="main", bitRate=2048)
 
     def test_set_audio_cfg(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.side_effect = [AUDIO_CFG_RESPONSE, SET_SUCCESS_RESPONSE]
-        mock_post.return_value = mock_response
+        mock_response.payloads = iter((AUDIO_CFG_RESPONSE, SET_SUCCESS_RESPONSE))
 
         logged_in_client.set_audio_cfg(micVolume=50)
 
     def test_set_ai_cfg(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.side_effect = [AI_CFG_RESPONSE, SET_SUCCESS_RESPONSE]
-        mock_post.return_value = mock_response
+        mock_response.payloads = iter((AI_CFG_RESPONSE, SET_SUCCESS_RESPONSE))
 
         logged_in_client.set_ai_cfg(people=0)
 
@@ -481,59 +420,50 @@ class TestAlertMethods:
     """Tests for alert and notification methods."""
 
     def test_set_audio_alarm(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = SET_SUCCESS_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = SET_SUCCESS_RESPONSE
 
         logged_in_client.set_audio_alarm(enable=True)
 
     def test_audio_alarm_play(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = SET_SUCCESS_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = SET_SUCCESS_RESPONSE
 
         logged_in_client.audio_alarm_play(manual_switch=1)
 
     def test_get_push(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = PUSH_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = PUSH_RESPONSE
 
         info = logged_in_client.get_push()
         assert info["enable"] == 1
 
     def test_set_push(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = SET_SUCCESS_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = SET_SUCCESS_RESPONSE
 
         logged_in_client.set_push(enable=False)
 
     def test_get_ftp(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = FTP_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = FTP_RESPONSE
 
         info = logged_in_client.get_ftp()
         assert info["server"] == "ftp.example.com"
 
     def test_set_ftp(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.side_effect = [FTP_RESPONSE, SET_SUCCESS_RESPONSE]
-        mock_post.return_value = mock_response
+        mock_response.payloads = iter((FTP_RESPONSE, SET_SUCCESS_RESPONSE))
 
         logged_in_client.set_ftp(enable=True)
 
     def test_get_email(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = EMAIL_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = EMAIL_RESPONSE
 
         info = logged_in_client.get_email()
         assert info["addr1"] == "test@example.com"
 
     def test_set_email(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.side_effect = [EMAIL_RESPONSE, SET_SUCCESS_RESPONSE]
-        mock_post.return_value = mock_response
+        mock_response.payloads = iter((EMAIL_RESPONSE, SET_SUCCESS_RESPONSE))
 
         logged_in_client.set_email(enable=True)
 
     def test_set_rec(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.side_effect = [REC_RESPONSE, SET_SUCCESS_RESPONSE]
-        mock_post.return_value = mock_response
+        mock_response.payloads = iter((REC_RESPONSE, SET_SUCCESS_RESPONSE))
 
         logged_in_client.set_rec(enable=False)
 
@@ -542,54 +472,46 @@ class TestSystemAdmin:
     """Tests for system admin methods."""
 
     def test_reboot(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = SET_SUCCESS_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = SET_SUCCESS_RESPONSE
 
         logged_in_client.reboot()
 
     def test_check_firmware(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = CHECK_FIRMWARE_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = CHECK_FIRMWARE_RESPONSE
 
         info = logged_in_client.check_firmware()
         assert info["needUpgrade"] == 1
 
     def test_get_ntp(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = NTP_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = NTP_RESPONSE
 
         info = logged_in_client.get_ntp()
         assert info["server"] == "pool.ntp.org"
 
     def test_set_ntp(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.side_effect = [NTP_RESPONSE, SET_SUCCESS_RESPONSE]
-        mock_post.return_value = mock_response
+        mock_response.payloads = iter((NTP_RESPONSE, SET_SUCCESS_RESPONSE))
 
         logged_in_client.set_ntp(server="time.google.com")
 
     def test_get_user(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = USER_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = USER_RESPONSE
 
         users = logged_in_client.get_user()
         assert len(users) == 2
         assert users[0]["userName"] == "admin"
 
     def test_get_online(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = ONLINE_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = ONLINE_RESPONSE
 
         sessions = logged_in_client.get_online()
         assert len(sessions) == 1
 
     def test_add_user(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = SET_SUCCESS_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = SET_SUCCESS_RESPONSE
 
         logged_in_client.add_user("newuser", "pass123", level="guest")
 
     def test_delete_user(self, logged_in_client, mock_post, mock_response):
-        mock_response.json.return_value = SET_SUCCESS_RESPONSE
-        mock_post.return_value = mock_response
+        mock_response.payload = SET_SUCCESS_RESPONSE
 
         logged_in_client.delete_user("olduser")